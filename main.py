@@ -1,5 +1,8 @@
 from pdfmaker import Document
 
+# Sample text used by every paragraph of the example
+LOREM = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.'
+
 # Document example
 
 # Document initialization
@@ -22,38 +25,40 @@ d.new_page()
 d.toggle_page_count()
 d.add_template_image(name='watermark',file='Example.png', axisx='right', size_proportions=0.2, posx= 10, posy=20)
 
-# Next pages
-d.add_section('Title Example', style = 'large_title')
-d.add_space()
-# First section: Image example
-d.add_title('Section 1')
-d.add_space()
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_image('Example.png', position='center')
-d.add_section('Example image', style='caption')
-d.add_space()
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_space()
-# Second section: Table example
-d.add_title('Section 2')
-d.add_space()
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_space(15)
+# Next pages, added from a single list of elements
 table = [['Table Header 1', 'Table Header 2'],['Table Text 1', 'Table Text 2'],['Table Text 3', 'Table Text 4']]
-d.add_table(table, col_widths=[100,100])
-d.add_space(2)
-d.add_section('Example table', style='caption')
-d.add_space()
-d.add_paragraph('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed vel feugiat mauris. Nullam tincidunt quam eget arcu mattis ornare. Sed porttitor leo ut nisi molestie, non lobortis purus pharetra. Phasellus dignissim libero odio, nec blandit nibh euismod nec. Nunc bibendum malesuada nisl sed bibendum. Etiam sit amet est nec mauris ultricies convallis sit amet sed nisl. Cras placerat in odio eu pretium. Sed accumsan ex dolor, sit amet porttitor sem faucibus et. Nullam mi velit, bibendum eget est rhoncus, ullamcorper vehicula massa. Donec mollis orci a turpis semper mollis. Cras mollis lectus non tellus mattis pharetra. Nunc lorem dolor, rutrum eget ultricies non, cursus eu diam.')
-d.add_space(15)
 table2 = [['Example']*8]*5
-d.add_table(table2, col_widths='uniform', style='table2')
-d.add_space(2)
-d.add_section('Example table with no header', style='caption')
+d.add_many([
+    ('section', {'text': 'Title Example', 'style': 'large_title'}),
+    ('space', {}),
+    # First section: Image example
+    ('title', {'text': 'Section 1'}),
+    ('space', {}),
+    ('paragraph', {'text': LOREM}),
+    ('paragraph', {'text': LOREM}),
+    ('image', {'file': 'Example.png', 'position': 'center'}),
+    ('section', {'text': 'Example image', 'style': 'caption'}),
+    ('space', {}),
+    ('paragraph', {'text': LOREM}),
+    ('paragraph', {'text': LOREM}),
+    ('paragraph', {'text': LOREM}),
+    ('paragraph', {'text': LOREM}),
+    ('space', {}),
+    # Second section: Table example
+    ('title', {'text': 'Section 2'}),
+    ('space', {}),
+    ('paragraph', {'text': LOREM}),
+    ('space', {'height': 15}),
+    ('table', {'data': table, 'col_widths': [100,100]}),
+    ('space', {'height': 2}),
+    ('section', {'text': 'Example table', 'style': 'caption'}),
+    ('space', {}),
+    ('paragraph', {'text': LOREM}),
+    ('space', {'height': 15}),
+    ('table', {'data': table2, 'col_widths': 'uniform', 'style': 'table2'}),
+    ('space', {'height': 2}),
+    ('section', {'text': 'Example table with no header', 'style': 'caption'})
+])
 
 # Saving document as PDF
 d.save()
\ No newline at end of file
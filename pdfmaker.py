@@ -1,15 +1,147 @@
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Paragraph, Table, TableStyle
 from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_JUSTIFY
+from reportlab.pdfbase.pdfmetrics import getFont
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from copy import deepcopy
+from reportlab.lib.utils import ImageReader
 from PIL import Image
 import pandas as pd
 import numpy as np
+import io
+import numbers
+import re
+import struct
+import os
+
+# Number of wrapped Paragraphs each Document keeps for repeated texts
+_PARAGRAPH_CACHE_SIZE = 128
+
+# Table cell text that has no whitespace or markup, so it is drawn the same without a Paragraph
+_PLAIN_CELL = re.compile(r'[^\s<>&]+')
+
+_IMAGE_SIZE_CACHE = {}
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_JPEG_SIGNATURE = b'\xff\xd8'
+# JPEG start of frame markers, which hold the size of the image (excluding DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+def _read_header_size(file):
+    """
+    Read the size of a PNG or JPEG image from its header, without decoding the image.
+
+    For PNG images the size is read from the IHDR chunk. For JPEG images the segments are skipped
+    until the start of frame segment, which holds the size.
+
+    :param file: Path to the image file.
+
+    :return: A tuple (width, height) with the size of the image in pixels, or None if the file is
+            not a PNG or JPEG image (or its header could not be read).
+    """
+    with open(file, 'rb') as f:
+        header = f.read(24)
+        if len(header) == 24 and header[:8] == _PNG_SIGNATURE and header[12:16] == b'IHDR':
+            return struct.unpack('>II', header[16:24])
+
+        if header[:2] != _JPEG_SIGNATURE:
+            return None
+        f.seek(2)
+        while True:
+            segment = f.read(4)
+            if len(segment) < 4 or segment[0] != 0xFF:
+                return None
+            marker, length = segment[1], struct.unpack('>H', segment[2:4])[0]
+            if marker == 0xFF or length < 2:
+                return None
+            if marker in _JPEG_SOF_MARKERS:
+                frame = f.read(5)
+                if len(frame) < 5:
+                    return None
+                height, width = struct.unpack('>HH', frame[1:5])
+                return width, height
+            f.seek(length - 2, os.SEEK_CUR)
+
+def _get_image_size(file):
+    """
+    Get the size in pixels of an image, opening the file only the first time it is seen.
+
+    Sizes are cached by absolute path, modification time and file size, so an image that is replaced
+    on disk is read again. File-like objects are not cached.
+
+    :param file: Path to the image file (or a file-like object).
+
+    :return: A tuple (width, height) with the size of the image in pixels.
+    """
+    try:
+        if not isinstance(file, (str, os.PathLike)):
+            with Image.open(file) as img:
+                return img.size
+
+        stat = os.stat(file)
+        key = (os.path.abspath(file), stat.st_mtime_ns, stat.st_size)
+        if key not in _IMAGE_SIZE_CACHE:
+            size = _read_header_size(file)
+            if size is None:
+                with Image.open(file) as img:
+                    size = img.size
+            _IMAGE_SIZE_CACHE[key] = size
+        return _IMAGE_SIZE_CACHE[key]
+    except IOError:
+        raise FileNotFoundError(f"Cannot open image file: {file}")
+
+# Encoded PNG data of the downsampled images, bounded to the most recent ones
+_THUMBNAIL_CACHE = {}
+_THUMBNAIL_CACHE_SIZE = 32
+# Images smaller than this (in pixels, on both axes) are always embedded as they are
+_THUMBNAIL_MIN_SIZE = 1024
+
+def _get_thumbnail(file, draw_width, draw_height):
+    """
+    Get a downsampled copy of an image that is drawn much smaller than its resolution.
+
+    Large images (e.g. a high resolution logo used as a template image) drawn at less than half of
+    their size in pixels in both axes are downsampled to twice the drawn size, so they don't make the
+    document bigger and slower to render than needed. The encoded copies are cached by absolute path,
+    modification time, file size and target size, and each call gets its own `ImageReader`, so the
+    decoded image data ReportLab keeps on it is released with the Document that uses it.
+
+    :param file: Path to the image file.
+    :param draw_width: The width the image is drawn with on the page.
+    :param draw_height: The height the image is drawn with on the page.
+
+    :return: An `ImageReader` with the downsampled image, or `file` itself if it doesn't need to be
+            downsampled.
+    """
+    img_width, img_height = _get_image_size(file)
+    if not isinstance(file, (str, os.PathLike)) or max(img_width, img_height) < _THUMBNAIL_MIN_SIZE:
+        return file
+    if draw_width * 2 >= img_width or draw_height * 2 >= img_height:
+        return file
+
+    target = (max(1, round(draw_width * 2)), max(1, round(draw_height * 2)))
+    stat = os.stat(file)
+    key = (os.path.abspath(file), stat.st_mtime_ns, stat.st_size, target)
+    if key not in _THUMBNAIL_CACHE:
+        with Image.open(file) as img:
+            # Palette images can only be resized with nearest neighbour resampling
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+            img.thumbnail(target, Image.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, format='PNG')
+        if len(_THUMBNAIL_CACHE) >= _THUMBNAIL_CACHE_SIZE:
+            _THUMBNAIL_CACHE.pop(next(iter(_THUMBNAIL_CACHE)))
+        _THUMBNAIL_CACHE[key] = buffer.getvalue()
+    return ImageReader(io.BytesIO(_THUMBNAIL_CACHE[key]))
 
 class Document:
+    __slots__ = ('name', '_width', '_height', 'page', '_margin_top', '_margin_left', '_margin_right', '_margin_bottom', 
+                 '_page_break_threshold', '_content_width', '_top_y', 'current_height', 'page_count', 
+                 'page_number', 'style_list', 'table_style_list', '_table_text_styles', '_table_style_cache', 
+                 'template_images', '_paragraph_cache')
+
     def __init__(self, name='document.pdf', width=letter[0], height=letter[1], margin_top = inch, margin_left = inch, 
                  margin_right = inch, margin_bottom = inch):
         """
@@ -24,13 +156,14 @@ class Document:
         :param margin_bottom: The bottom margin of the document page (default is 1 inch).
         """
         self.name = name
-        self.width = width
-        self.height = height
+        self._width = width
+        self._height = height
         self.page = canvas.Canvas(name, pagesize=(width, height))
-        self.margin_top = margin_top
-        self.margin_left = margin_left
-        self.margin_right = margin_right
-        self.margin_bottom = margin_bottom
+        self._margin_top = margin_top
+        self._margin_left = margin_left
+        self._margin_right = margin_right
+        self._margin_bottom = margin_bottom
+        self._update_layout()
 
         self.current_height = 0
         self.page_count = False
@@ -39,8 +172,86 @@ class Document:
         self.style_list = {}
         self._initialize_styles()
         self.table_style_list = {}
+        self._table_text_styles = {}
+        self._table_style_cache = {}
         self._initialize_table_styles()
         self.template_images = {}
+        self._paragraph_cache = {}
+
+    @property
+    def width(self):
+        """The width of the document page."""
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = value
+        self._update_layout()
+        self._update_template_positions()
+
+    @property
+    def height(self):
+        """The height of the document page."""
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = value
+        self._update_layout()
+        self._update_template_positions()
+
+    @property
+    def margin_top(self):
+        """The top margin of the document page."""
+        return self._margin_top
+
+    @margin_top.setter
+    def margin_top(self, value):
+        self._margin_top = value
+        self._update_layout()
+
+    @property
+    def margin_left(self):
+        """The left margin of the document page."""
+        return self._margin_left
+
+    @margin_left.setter
+    def margin_left(self, value):
+        self._margin_left = value
+        self._update_layout()
+
+    @property
+    def margin_right(self):
+        """The right margin of the document page."""
+        return self._margin_right
+
+    @margin_right.setter
+    def margin_right(self, value):
+        self._margin_right = value
+        self._update_layout()
+
+    @property
+    def margin_bottom(self):
+        """The bottom margin of the document page."""
+        return self._margin_bottom
+
+    @margin_bottom.setter
+    def margin_bottom(self, value):
+        self._margin_bottom = value
+        self._update_layout()
+
+    def _update_layout(self):
+        """
+        Recompute the layout values derived from the page size and margins.
+
+        Called whenever the page size or a margin is set, so the page break check and the drawing
+        positions always follow the current page size and margins.
+        """
+        # Largest content height that still fits between the top and bottom margins
+        self._page_break_threshold = self._height - self._margin_top - self._margin_bottom
+        # Width between the side margins and y coordinate of the top margin
+        self._content_width = self._width - self._margin_left - self._margin_right
+        self._top_y = self._height - self._margin_top
 
     def _initialize_styles(self):
         """
@@ -108,7 +319,7 @@ class Document:
         This method performs several actions:
         - Adds the current page number to the page if enabled.
         - Inserts template images on the page if there are any.
-        - Saves the current state of the page and starts a new one.
+        - Finishes the current page and starts a new one.
         - Resets the current height to zero and increments the page number if page counting is enabled.
         """
         # Add the current page number to the page
@@ -117,12 +328,11 @@ class Document:
         # Insert template images on the page if there are any
         for i in self.template_images:
             img = self.template_images[i]
-            self.add_image(file=img['file'], size_proportions = img['size_proportions'], width = img['width'], 
-                           height = img['height'], position='absolute', posx = img['posx'], posy = img['posy'], 
-                           axisx = img['axisx'], axisy = img['axisy'])
+            # The image is embedded once and only referenced again on each page
+            self.page.drawImage(img['image'], img['left_margin'], img['bottom_margin'], img['img_width'], 
+                                img['img_height'])
 
-        # Save the current page state and start a new page
-        self.page.saveState()
+        # Start a new page
         self.page.showPage()
 
         # Reset the height for the new page and update the page number if counting is enabled
@@ -136,16 +346,25 @@ class Document:
 
         This method:
         - Checks if page numbering is enabled via `self.page_count`.
-        - Creates a Paragraph object with the current page number.
-        - Calculates the width and height of the page number text.
-        - Draws the page number centered at the bottom of the page.
+        - Draws the page number at the bottom of the page directly on the canvas, with the font and
+          alignment of the page number style.
         """
         if self.page_count:
-            page_number_text = Paragraph(str(self.page_number), self.style_list['page_number'])
-            w_title, h_title = page_number_text.wrap(self.width, self.height)
-            x_position = (self.width - w_title) / 2
-            y_position = self.margin_bottom / 2
-            page_number_text.drawOn(self.page, x_position, y_position)
+            style = self.style_list['page_number']
+            text = str(self.page_number)
+            # Same baseline and placement as a single line Paragraph as wide as the page, drawn at half
+            # the bottom margin (a justified single line is left aligned)
+            y_position = self.margin_bottom / 2 + style.leading - style.fontSize
+            self.page.saveState()
+            self.page.setFillColor(style.textColor)
+            self.page.setFont(style.fontName, style.fontSize)
+            if style.alignment in (TA_LEFT, TA_JUSTIFY):
+                self.page.drawString(0, y_position, text)
+            elif style.alignment == TA_RIGHT:
+                self.page.drawRightString(self.width, y_position, text)
+            else:
+                self.page.drawCentredString(self.width / 2, y_position, text)
+            self.page.restoreState()
 
     def toggle_page_count(self, page_number = None, set = None):
         """
@@ -168,7 +387,7 @@ class Document:
         This method calculates whether the current content will exceed the page height,
         considering margins. If so, it triggers a new page to be started.
         """
-        if self.current_height+self.margin_top + self.margin_bottom > self.height:
+        if self.current_height > self._page_break_threshold:
             self.new_page()
 
     def add_section(self, text='Text', style = 'paragraph'):
@@ -179,7 +398,8 @@ class Document:
         - Validates that the provided style exists in `self.style_list`.
         - Converts the text into a string and attempts to add it to the current page.
         - Checks if the text fits on the current page or needs to be split across pages.
-        - Handles pagination if the text exceeds the available space on the current page.
+        - Handles pagination if the text exceeds the available space on the current page, sending the
+          largest number of words that fits (found by binary search) and continuing on a new page.
 
         :param text: The text content of the section. Defaults to 'Text'.
         :param style: The style to apply to the text. Must be a key in `self.style_list`. Defaults to 'paragraph'.
@@ -190,44 +410,157 @@ class Document:
             raise ValueError(f"Style '{style}' is not defined in style_list.")
 
         self.verify_page_break()
+        self._send_text(str(text), self.style_list[style], self._content_width)
 
-        text = str(text)
-        sent = False
-        has_split = False
-        pointer = len(text.split(' ')) - 1
+    def _send_text(self, text, paragraph_style, available_width):
+        """
+        Draw a text on the document, splitting it across pages if it doesn't fit on the current one.
 
-        # Verify if it's necessary to split text into different pages
-        while not sent:
-            title = Paragraph(text, self.style_list[style])
-            w_title, h_title = title.wrap(self.width - self.margin_left - self.margin_right, self.height)
+        :param text: The text content to draw.
+        :param paragraph_style: The `ParagraphStyle` to apply to the text.
+        :param available_width: The width available for the text.
+        """
+        words = text.split(' ')
+
+        # Only the whole text is wrapped (through the cache). A text that doesn't fit is split with the
+        # words that fit on each page, estimated from the height per word of the whole text
+        title, w_title, h_title = self._wrap_paragraph(text, paragraph_style, available_width)
+        height_per_word = h_title / len(words)
+        fits = h_title <= self._page_break_threshold - self.current_height
+
+        # Send the text page by page until nothing is left
+        while words:
+            pointer = len(words)
+
+            if not fits:
+                available_height = self._page_break_threshold - self.current_height
+                estimate = int(available_height / height_per_word) if height_per_word > 0 else len(words)
+                title, h_title, pointer = self._fit_words(words, paragraph_style, available_width, estimate)
+
+                if title is None:
+                    if self.current_height > 0:
+                        # Margin too small, add a new page and try again
+                        self.new_page()
+                        continue
+                    # Not even one word fits on an empty page, send it anyway so the text can advance
+                    title = Paragraph(words[0], paragraph_style)
+                    w_title, h_title = title.wrap(available_width, self.height)
+                    pointer = 1
+
+            # Send text
+            title.drawOn(self.page, self.margin_left, self._top_y - self.current_height - h_title)
+            self.current_height += h_title
+
+            # Send the rest of the split text on a new page
+            words = words[pointer:]
+            fits = False
+            if words:
+                self.new_page()
+
+    def _wrap_paragraph(self, text, paragraph_style, available_width):
+        """
+        Build a Paragraph and wrap it, reusing the result for the same text, style and width.
 
-            page_break_needed  = self.current_height+self.margin_top + self.margin_bottom +h_title > self.height
+        Parsing the markup of a Paragraph and breaking it into lines are the expensive parts of laying
+        out text, so documents that repeat the same text (e.g. boilerplate paragraphs) only pay for them
+        once. The cache belongs to the Document and keeps the most recent entries. It is keyed on the
+        values of the style attributes, so a style changed in place is not served a stale Paragraph.
 
-            if not page_break_needed :
-                # Send text
-                title.drawOn(self.page, self.margin_left, self.height - self.margin_top - self.current_height - h_title)
-                self.current_height += h_title
-                sent = True
+        :param text: The text content of the paragraph.
+        :param paragraph_style: The `ParagraphStyle` to apply to the text.
+        :param available_width: The width available for the text.
 
-                if has_split:
-                    # Send the rest of the split text
-                    new_text = text.split(' ')[pointer+1:]
-                    new_text = " ".join(new_text)
-                    self.new_page()
-                    self.add_section(text = new_text, style = style )
+        :return: A tuple (paragraph, width, height) with the wrapped `Paragraph` and its size.
+        """
+        try:
+            key = (text, available_width, tuple(paragraph_style.__dict__.items()))
+            result = self._paragraph_cache.get(key)
+        except TypeError:
+            # Styles with unhashable attribute values are not cached
+            key = result = None
+
+        if result is None:
+            paragraph = Paragraph(text, paragraph_style)
+            w_paragraph, h_paragraph = paragraph.wrap(available_width, self.height)
+            result = (paragraph, w_paragraph, h_paragraph)
+            if key is not None:
+                if len(self._paragraph_cache) >= _PARAGRAPH_CACHE_SIZE:
+                    self._paragraph_cache.pop(next(iter(self._paragraph_cache)))
+                self._paragraph_cache[key] = result
+        return result
+
+    def _wrap_words(self, words, count, paragraph_style, available_width):
+        """
+        Build a paragraph with the first words of a text and check if it fits on the current page.
+
+        :param words: The words of the text.
+        :param count: The number of words to use.
+        :param paragraph_style: The `ParagraphStyle` to apply to the text.
+        :param available_width: The width available for the text.
+
+        :return: A tuple (paragraph, height, fits) with the wrapped `Paragraph`, its height and whether
+                it fits on the current page.
+        """
+        paragraph = Paragraph(" ".join(words[:count]), paragraph_style)
+        w_paragraph, h_paragraph = paragraph.wrap(available_width, self.height)
+        fits = self.current_height + h_paragraph <= self._page_break_threshold
+        return paragraph, h_paragraph, fits
+
+    def _fit_words(self, words, paragraph_style, available_width, estimate):
+        """
+        Find the largest number of words of a text that fits on the current page.
+
+        The search starts at an estimate and moves away from it with doubling steps until the answer
+        is bracketed, then finishes with a binary search. A close estimate only needs a few
+        `Paragraph.wrap` calls.
+
+        :param words: The words of the text.
+        :param paragraph_style: The `ParagraphStyle` to apply to the text.
+        :param available_width: The width available for the text.
+        :param estimate: The estimated number of words that fit.
+
+        :return: A tuple (paragraph, height, count) with the wrapped `Paragraph` of the first `count`
+                words and its height, or (None, 0, 0) if not even one word fits.
+        """
+        count = min(max(estimate, 1), len(words))
+        best = (None, 0, 0)
+
+        paragraph, h_paragraph, fits = self._wrap_words(words, count, paragraph_style, available_width)
+        step = 1
+        if fits:
+            # Move forward until some number of words doesn't fit
+            best = (paragraph, h_paragraph, count)
+            low, high = count, len(words) + 1
+            while low + step < high:
+                paragraph, h_paragraph, fits = self._wrap_words(words, low + step, paragraph_style, available_width)
+                if not fits:
+                    high = low + step
+                    break
+                low += step
+                best = (paragraph, h_paragraph, low)
+                step *= 2
+        else:
+            # Move backward until some number of words fits
+            low, high = 0, count
+            while high - step > low:
+                paragraph, h_paragraph, fits = self._wrap_words(words, high - step, paragraph_style, available_width)
+                if fits:
+                    low = high - step
+                    best = (paragraph, h_paragraph, low)
+                    break
+                high -= step
+                step *= 2
+
+        # Binary search between the largest count known to fit and the smallest known not to fit
+        while high - low > 1:
+            middle = (low + high) // 2
+            paragraph, h_paragraph, fits = self._wrap_words(words, middle, paragraph_style, available_width)
+            if fits:
+                low = middle
+                best = (paragraph, h_paragraph, middle)
             else:
-                # Split text and try to send again
-                if pointer > 0:
-                    # Split the text to make it smaller
-                    has_split = True
-                    text_split = text.split(' ')[:pointer]
-                    text = " ".join(text_split)
-                    pointer -= 1
-                else:
-                    # Margin too small, add a new page and try again
-                    has_split = False
-                    pointer = len(text.split(' ')) - 1
-                    self.new_page()
+                high = middle
+        return best
 
     def add_sections(self, text='Text', style = 'paragraph'): 
         """
@@ -236,9 +569,16 @@ class Document:
         :param text: The text content of the section. 
         :param style: The style to apply to the text (must be a key in self.style_list).
         """
-        texts = text.split('\n')
-        for i in texts:
-            self.add_section(text=i, style=style)
+        # Validate parameters
+        if style not in self.style_list:
+            raise ValueError(f"Style '{style}' is not defined in style_list.")
+
+        # The style and width are looked up once for every line
+        paragraph_style = self.style_list[style]
+        available_width = self._content_width
+        for line in text.split('\n'):
+            self.verify_page_break()
+            self._send_text(line, paragraph_style, available_width)
 
     def add_title(self, text='Title'):
         """
@@ -350,27 +690,23 @@ class Document:
         if position not in ['center', 'absolute', 'default']:
             raise ValueError("Position must be 'center', 'absolute', or 'default'.")
 
-         # Open the image
-        try:
-            with Image.open(file) as img:
-                img_width, img_height = img.size
-        except IOError:
-            raise FileNotFoundError(f"Cannot open image file: {file}")
-        
+        # Get the image size
+        img_width, img_height = _get_image_size(file)
+
         img_width *= size_proportions * width
         img_height *= size_proportions * height
 
         # Center of line
         if position == 'center':
             left_margin = self.width/2 - img_width/2
-            bottom_margin = self.height - self.margin_top - self.current_height - img_height
+            bottom_margin = self._top_y - self.current_height - img_height
         # Absolute position on page
         elif position == 'absolute':
             left_margin, bottom_margin = self._set_absolute_positions(axisx, axisy, img_width, img_height, posx, posy)
         # Default 
         else:
             left_margin = self.margin_left
-            bottom_margin = self.height - self.margin_top - self.current_height - img_height
+            bottom_margin = self._top_y - self.current_height - img_height
 
         # Add the image to the page
         self.page.drawImage(file, left_margin, bottom_margin, img_width, img_height)
@@ -396,84 +732,198 @@ class Document:
         """
         self.verify_page_break()
 
+        # DataFrames and arrays become lists of rows, the caller's rows are only read and copied once
+        # into the rows sent to the table
+        numeric_columns = []
         if isinstance(data, pd.DataFrame):
-            columns = data.columns.tolist()
-            data = data.values.tolist()
-            data = [columns] + data
-        
-        if isinstance(data, np.ndarray):
+            numeric_columns = [j for j, dtype in enumerate(data.dtypes) if pd.api.types.is_numeric_dtype(dtype)]
+            data = [data.columns.tolist(), *data.to_numpy().tolist()]
+        elif isinstance(data, np.ndarray):
             data = data.tolist()
 
-        data = [row[:] for row in data]
-
         table_style_dict = self.table_style_list[style]
-        table_style = self.generate_table(table_style_dict)
-        
-        data_send = deepcopy(data)
+        # The TableStyle is generated once per table style and wrap mode and reused by every table drawn with it
+        if (style, wrap) not in self._table_style_cache:
+            table_style = self.generate_table(table_style_dict)
+            if wrap:
+                # Plain cells are drawn with the same leading as the wrapped ones
+                table_style = TableStyle([('LEADING', (0, 0), (-1, -1), table_style_dict['fontSize']+2)], 
+                                         parent=table_style)
+            self._table_style_cache[(style, wrap)] = table_style
+        table_style = self._table_style_cache[(style, wrap)]
         
-        # Makes text wrap to new line when too large
-        if wrap:
-            style_header = ParagraphStyle("Header", fontName = table_style_dict['fontName'], fontSize = table_style_dict['fontSize'], alignment=1, leading= table_style_dict['fontSize']+2, encoding="utf-8", textColor=table_style_dict['headerTextColor'])
-            style_text = ParagraphStyle("Table", fontName = table_style_dict['fontName'], fontSize = table_style_dict['fontSize'], alignment=1, leading= table_style_dict['fontSize']+2, encoding="utf-8", textColor=table_style_dict['textColor'])
-            
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    if i==0 and table_style_dict['header']:
-                        data_send[i][j] = Paragraph(str(data[i][j]), style_header)
-                    else:
-                        data_send[i][j] = Paragraph(str(data[i][j]), style_text)
+        data_send = [list(row) for row in data]
         
         # Divides columns equally if width was set to uniform
         if col_widths == 'uniform':
             n_cols = len(data[0])
-            total_width = self.width - self.margin_left - self.margin_right
-            col_widths = total_width / n_cols
+            col_widths = self._content_width / n_cols
         
-        pointer = len(data)
-        sent = False
-
-        # Verify if it's necessary to split text into different pages
-        while not sent: 
-
-            table = Table(data_send[:pointer], colWidths=col_widths)
-            table.setStyle(table_style)
-            w_table, h_table = table.wrapOn(self.page, 0, 0)
-            total_current_height = self.margin_top + self.current_height + h_table
-            limit = self.height - self.margin_bottom
-
-            # Too long to be sent in its current form
-            if total_current_height > limit:
-                if pointer > 1:
-                    # Reduce the size of the table and try to send again
-                    pointer -= 1
-                else:
-                    # Make another page and try to send everything again
+        # Makes text wrap to new line when too large
+        if wrap:
+            style_header, style_text = self._get_table_text_styles(style)
+            font_size = table_style_dict['fontSize']
+            # Resolve the font once instead of looking it up in the font registry for every cell
+            string_width = getFont(table_style_dict['fontName']).stringWidth
+
+            # Width left for the text of each column (12 is the default left and right padding), None if unknown
+            n_cols = max(len(row) for row in data) if data else 0
+            widths = col_widths if isinstance(col_widths, (list, tuple)) else [col_widths] * n_cols
+            text_widths = [w - 12 if isinstance(w, numbers.Real) and not isinstance(w, bool) else None for w in widths]
+            text_widths += [None] * (n_cols - len(text_widths))
+
+            # Values of numeric DataFrame columns have no whitespace or markup, so the whole column (below
+            # the column names) stays plain strings if its widest value fits
+            plain_columns = set()
+            for j in numeric_columns:
+                texts = [str(row[j]) for row in data[1:]]
+                widest = max((string_width(text, font_size) for text in set(texts)), default=0)
+                if text_widths[j] is None or widest <= text_widths[j]:
+                    plain_columns.add(j)
+                    for row_send, text in zip(data_send[1:], texts):
+                        row_send[j] = text
+
+            # Short cells that cannot wrap stay plain strings, other cells with the same text and style
+            # share a single Paragraph
+            paragraphs = {}
+            is_plain = _PLAIN_CELL.fullmatch
+            for i, row in enumerate(data):
+                cell_style = style_header if i==0 and table_style_dict['header'] else style_text
+                row_send = data_send[i]
+                for j, cell in enumerate(row):
+                    if i > 0 and j in plain_columns:
+                        continue
+                    text = str(cell)
+                    text_width = text_widths[j]
+                    if is_plain(text) and (text_width is None or string_width(text, font_size) <= text_width):
+                        row_send[j] = text
+                    else:
+                        key = (text, cell_style.name)
+                        if key not in paragraphs:
+                            paragraphs[key] = Paragraph(text, cell_style)
+                        row_send[j] = paragraphs[key]
+        
+        header = table_style_dict['header']
+
+        # Send the table page by page until every row is drawn. The row heights of the rows left to draw
+        # are measured once on the whole table and estimate how many rows fit on each page
+        row_heights = None
+        while data_send:
+            available_height = self._page_break_threshold - self.current_height
+            fits = False
+            if row_heights is None:
+                table, w_table, h_table = self._wrap_table(data_send, col_widths, table_style)
+                # _rowHeights is private to ReportLab, but only seeds the estimate, which is always checked
+                # with a real wrap. Without it every row is assumed to have the average height
+                row_heights = getattr(table, '_rowHeights', None)
+                if row_heights is None or len(row_heights) != len(data_send):
+                    row_heights = [h_table / len(data_send)] * len(data_send)
+                row_heights = np.array(row_heights)
+                pointer = len(data_send)
+                fits = h_table <= available_height
+
+            if not fits:
+                # Check the estimated number of rows and the next one before the binary search for the
+                # largest number of rows that fits on the current page
+                pointer = 1
+                low, high = 1, len(data_send)
+                estimate = int(np.searchsorted(np.cumsum(row_heights), available_height, side='right'))
+                for middle in (estimate, estimate + 1):
+                    if not low <= middle <= high:
+                        break
+                    candidate, w_candidate, h_candidate = self._wrap_table(data_send[:middle], col_widths, table_style)
+                    if h_candidate > available_height:
+                        high = middle - 1
+                        break
+                    table, w_table, h_table, pointer, fits = candidate, w_candidate, h_candidate, middle, True
+                    low = middle + 1
+                while low <= high:
+                    middle = (low + high) // 2
+                    candidate, w_candidate, h_candidate = self._wrap_table(data_send[:middle], col_widths, table_style)
+                    if h_candidate <= available_height:
+                        table, w_table, h_table, pointer, fits = candidate, w_candidate, h_candidate, middle, True
+                        low = middle + 1
+                    else:
+                        high = middle - 1
+
+            # If nothing fits or it can only display the header in this page, make another page
+            only_header = pointer == 1 and len(data_send) > 1 and header
+            if not fits or only_header:
+                if self.current_height > 0:
                     self.new_page()
-                    pointer = len(data_send)
-            # Can be sent in its current form
+                    continue
+                # Not even one row fits on an empty page, send it anyway so the table can advance
+                pointer = 2 if header and len(data_send) > 1 else 1
+                table, w_table, h_table = self._wrap_table(data_send[:pointer], col_widths, table_style)
+
+            if position == 'default':
+                left_margin = self.margin_left
             else:
-                sent = True
-
-                if position == 'default':
-                    left_margin = self.margin_left
-                else:
-                    left_margin = (self.width - w_table)/2
-                
-                # If it can only display the header in this page, don't display it and make another page
-                if pointer == 1 and len(data) > 1 and table_style_dict['header']:
-                    self.new_page()
-                else:
-                    table.drawOn(self.page, left_margin, self.height - self.margin_top - self.current_height - h_table)
-                    self.current_height += h_table
-                    
-                # Keep making the table on the other page
-                if pointer != len(data_send):
-                    # If it has a header, copy the header on every page until the table is complete
-                    if table_style_dict['header']:
-                        self.add_table(data = [data[0]]+data[pointer:], col_widths=col_widths, style=style, position=position, wrap=wrap)
-                    else:
-                        self.add_table(data = data[pointer:], col_widths=col_widths, style=style, position=position, wrap=wrap)
+                left_margin = (self.width - w_table)/2
+
+            table.drawOn(self.page, left_margin, self._top_y - self.current_height - h_table)
+            self.current_height += h_table
+
+            if pointer == len(data_send):
+                break
+
+            # Keep making the table on the other page, copying the header on every page if it has one
+            if header:
+                data_send = [data_send[0]] + data_send[pointer:]
+                row_heights = np.concatenate((row_heights[:1], row_heights[pointer:]))
+            else:
+                data_send = data_send[pointer:]
+                row_heights = row_heights[pointer:]
+            self.new_page()
     
+    def _wrap_table(self, data, col_widths, table_style):
+        """
+        Build a table with the given rows and calculate its size on the page.
+
+        :param data: The rows of the table, as a list of lists.
+        :param col_widths: Column widths for the table.
+        :param table_style: The `TableStyle` object to apply to the table.
+
+        :return: A tuple (table, width, height) with the wrapped `Table` and its size.
+        """
+        table = Table(data, colWidths=col_widths)
+        table.setStyle(table_style)
+        w_table, h_table = table.wrapOn(self.page, 0, 0)
+        return table, w_table, h_table
+
+    def add_many(self, items):
+        """
+        Add several elements to the document in order from a single list.
+
+        Each item is a tuple (kind, params), where `kind` names the element to add and `params` is a
+        dictionary with the keyword arguments of the corresponding method:
+        - 'section': `add_section`
+        - 'sections': `add_sections`
+        - 'title': `add_title`
+        - 'paragraph': `add_paragraph`
+        - 'space': `add_space`
+        - 'image': `add_image`
+        - 'table': `add_table`
+        - 'new_page': `new_page`
+
+        :param items: A list of (kind, params) tuples, e.g. [('paragraph', {'text': 'Text'}), ('space', {'height': 15})].
+        """
+        methods = {
+            'section': self.add_section,
+            'sections': self.add_sections,
+            'title': self.add_title,
+            'paragraph': self.add_paragraph,
+            'space': self.add_space,
+            'image': self.add_image,
+            'table': self.add_table,
+            'new_page': self.new_page
+        }
+
+        for kind, params in items:
+            if kind not in methods:
+                raise ValueError(f"Element kind '{kind}' is not supported by add_many.")
+            methods[kind](**params)
+
     def table_style(self, name='table', fontName='Helvetica-Bold', fontSize=8, textColor = (0,0,0), backgroundColor=(1,1,1), gridColor = (0,0,0), gridSize = 1, header=True, headerColor=(0.5,0.5,0.5), headerTextColor=(1,1,1)):
         """
         Change configurations of some table style.
@@ -503,6 +953,28 @@ class Document:
             'headerColor': headerColor,
             'headerTextColor': headerTextColor
         }
+        self._table_text_styles.pop(name, None)
+        self._table_style_cache.pop((name, True), None)
+        self._table_style_cache.pop((name, False), None)
+
+    def _get_table_text_styles(self, name):
+        """
+        Get the paragraph styles used to wrap the text of table cells.
+
+        The styles are built once per table style and reused by every table drawn with it, including
+        the continuation of a table split across pages. They are rebuilt after the table style is
+        changed with `table_style`.
+
+        :param name: The name of the table style (must be a key in `self.table_style_list`).
+
+        :return: A tuple (style_header, style_text) with the `ParagraphStyle` of header and body cells.
+        """
+        if name not in self._table_text_styles:
+            style = self.table_style_list[name]
+            style_header = ParagraphStyle("Header", fontName = style['fontName'], fontSize = style['fontSize'], alignment=1, leading= style['fontSize']+2, encoding="utf-8", textColor=style['headerTextColor'])
+            style_text = ParagraphStyle("Table", fontName = style['fontName'], fontSize = style['fontSize'], alignment=1, leading= style['fontSize']+2, encoding="utf-8", textColor=style['textColor'])
+            self._table_text_styles[name] = (style_header, style_text)
+        return self._table_text_styles[name]
      
     def generate_table(self, style):
         """
@@ -555,6 +1027,17 @@ class Document:
         :param axisx: The horizontal alignment of the image ('left', 'center', 'right'). Defaults to 'left'.
         :param axisy: The vertical alignment of the image ('top', 'middle', 'bottom'). Defaults to 'top'.
         """
+        # Validate parameters
+        if size_proportions <= 0 or width <= 0 or height <= 0:
+            raise ValueError("Size proportions, width, and height must be positive values.")
+
+        # Size of the image on the page, downsampling it if it is drawn much smaller than its resolution
+        img_width, img_height = _get_image_size(file)
+        img_width *= size_proportions * width
+        img_height *= size_proportions * height
+        # The page size is fixed, so the position on the page is the same for every page
+        left_margin, bottom_margin = self._set_absolute_positions(axisx, axisy, img_width, img_height, posx, posy)
+
         self.template_images[name] = {
             'file': file,
             'size_proportions': size_proportions, 
@@ -563,9 +1046,22 @@ class Document:
             'posx': posx,
             'posy': posy,
             'axisx': axisx,
-            'axisy': axisy
+            'axisy': axisy,
+            'image': _get_thumbnail(file, img_width, img_height),
+            'img_width': img_width,
+            'img_height': img_height,
+            'left_margin': left_margin,
+            'bottom_margin': bottom_margin
         }
 
+    def _update_template_positions(self):
+        """
+        Recompute the positions of the template images on the page after the page size changes.
+        """
+        for img in self.template_images.values():
+            img['left_margin'], img['bottom_margin'] = self._set_absolute_positions(
+                img['axisx'], img['axisy'], img['img_width'], img['img_height'], img['posx'], img['posy'])
+
     def remove_template_image(self, name):
         """
         Remove a template image.